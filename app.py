@@ -2,26 +2,56 @@
 Application Entry Point.
 
 This module initializes the Flask application, loads environment variables,
-configures extensions (Mail, CSRF), and registers the main portfolio blueprint.
+configures extensions (Mail, CSRF, Cache, Limiter, Compress), and registers the main portfolio blueprint.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_mail import Mail
-from flask_wtf.csrf import CSRFProtect, generate_csrf
+from flask_compress import Compress
+from flask_wtf.csrf import CSRFProtect
+from werkzeug.middleware.proxy_fix import ProxyFix
 from dotenv import load_dotenv
-from portfolio import portfolio_bp
+from portfolio import portfolio_bp, cache, limiter
+from portfolio.routes import preload_data
 
 # Load environment variables from .env file
 load_dotenv()
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes `jsonify` responses with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # ==============================
 # Configuration
 # ==============================
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
 
+# CSRF is enforced explicitly on the contact form only, so public pages
+# never touch the session (no Set-Cookie, cacheable by proxies/CDNs)
+app.config["WTF_CSRF_CHECK_DEFAULT"] = False
+
+# Let the front-end server stream files (only behind a proxy that honors X-Sendfile)
+app.config["USE_X_SENDFILE"] = os.getenv("USE_X_SENDFILE", "False") == "True"
+
 # Mail Settings
 app.config["MAIL_SERVER"] = os.getenv("MAIL_SERVER")
 app.config["MAIL_PORT"] = int(os.getenv("MAIL_PORT", 587))
@@ -29,28 +59,64 @@ app.config["MAIL_USE_TLS"] = os.getenv("MAIL_USE_TLS", "True") == "True"
 app.config["MAIL_USERNAME"] = os.getenv("MAIL_USERNAME")
 app.config["MAIL_PASSWORD"] = os.getenv("MAIL_PASSWORD")
 app.config["MAIL_DEFAULT_SENDER"] = os.getenv("MAIL_DEFAULT_SENDER")
+# Send contact mail on a background thread. Only enable on long-lived
+# servers; serverless hosts may freeze the process once the response is sent
+app.config["MAIL_SEND_ASYNC"] = os.getenv("MAIL_SEND_ASYNC", "False") == "True"
+
+# Cache Settings (set CACHE_TYPE=NullCache to disable while editing templates)
+app.config["CACHE_TYPE"] = os.getenv("CACHE_TYPE", "SimpleCache")
+app.config["CACHE_DEFAULT_TIMEOUT"] = int(os.getenv("CACHE_DEFAULT_TIMEOUT", 300))
+
+# Compression Settings
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 512
+
+# Rate Limit Settings (per-process counters unless pointed at e.g. redis://)
+app.config["RATELIMIT_STORAGE_URI"] = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+# Number of reverse proxies in front of the app whose X-Forwarded-For /
+# X-Forwarded-Proto headers are trusted. Rate limits key on the client
+# address, so behind a proxy this must be set or every visitor shares the
+# proxy's bucket. Leave at 0 when clients connect directly (headers spoofable).
+app.config["TRUSTED_PROXY_COUNT"] = int(os.getenv("TRUSTED_PROXY_COUNT", 0))
 
 # ==============================
 # Initialize Extensions
 # ==============================
 mail = Mail(app)
 csrf = CSRFProtect(app)
+cache.init_app(app)
+limiter.init_app(app)
+Compress(app)
+
+# Take the client address/scheme from the trusted proxies' X-Forwarded-* headers
+if app.config["TRUSTED_PROXY_COUNT"]:
+    app.wsgi_app = ProxyFix(
+        app.wsgi_app,
+        x_for=app.config["TRUSTED_PROXY_COUNT"],
+        x_proto=app.config["TRUSTED_PROXY_COUNT"],
+    )
 
 # Inject mail instance into app context for easier access in routes
 app.mail = mail
 
-# ==============================
-# Context Processors
-# ==============================
-@app.context_processor
-def inject_csrf():
-    """Inject CSRF token generator into all templates."""
-    return {"csrf_token": generate_csrf}
+# Background workers for contact form delivery
+if app.config["MAIL_SEND_ASYNC"]:
+    app.mail_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mail")
 
 # ==============================
 # Register Blueprints
 # ==============================
 app.register_blueprint(portfolio_bp)
 
+# ==============================
+# Warm Up
+# ==============================
+# Parse page data and compile templates once at import so no request pays
+# for it (with `gunicorn --preload`, workers share these copy-on-write)
+with app.app_context():
+    preload_data()
+    for template_name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(template_name)
+
 if __name__ == "__main__":
     app.run(debug=True)
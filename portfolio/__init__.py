@@ -2,10 +2,14 @@
 Portfolio Blueprint Setup.
 
 Initializes the main Blueprint for the portfolio application, linking
-templates and static assets.
+templates and static assets, along with the page cache and rate limiter
+used by its views.
 """
 
 from flask import Blueprint
+from flask_caching import Cache
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 
 # Initialize the Blueprint
 portfolio_bp = Blueprint(
@@ -16,5 +20,11 @@ portfolio_bp = Blueprint(
     static_url_path="/portfolio/static"
 )
 
+# Rendered page cache (bound to the app in app.py)
+cache = Cache()
+
+# Per-client rate limiter (bound to the app in app.py)
+limiter = Limiter(get_remote_address)
+
 # Import routes to register them with the blueprint
 from . import routes
@@ -0,0 +1,75 @@
+"""
+Contact Mail Delivery.
+
+Keeps one Flask-Mail SMTP connection open for the whole process and reuses
+it across contact form submissions, so only the first message pays for the
+connect/STARTTLS/login handshake. Sends are serialized behind a lock (contact
+mail volume is tiny), stale connections are detected with a NOOP and
+reopened, and the connection is closed when the process exits.
+"""
+
+import atexit
+import smtplib
+import threading
+
+# Process-wide pooled connection, guarded by _lock
+_connection = None
+_lock = threading.Lock()
+
+
+def _close(connection):
+    """Quits an SMTP connection, ignoring errors from an already dead socket."""
+    try:
+        connection.__exit__(None, None, None)
+    except (smtplib.SMTPException, OSError):
+        pass
+
+
+def _is_alive(connection):
+    """Checks a pooled connection with a NOOP round trip."""
+    # MAIL_SUPPRESS_SEND connections have no host to check
+    if connection.host is None:
+        return True
+    try:
+        return connection.host.noop()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
+
+
+def _get_connection(mail):
+    """Returns the pooled SMTP connection, reopening it if it went stale. Call with _lock held."""
+    global _connection
+    if _connection is not None and not _is_alive(_connection):
+        _close(_connection)
+        _connection = None
+    if _connection is None:
+        connection = mail.connect()
+        connection.__enter__()
+        _connection = connection
+    return _connection
+
+
+def send_message(mail, msg):
+    """
+    Sends a message over the pooled connection.
+    On failure the connection is discarded so the next send starts fresh.
+    """
+    global _connection
+    with _lock:
+        connection = _get_connection(mail)
+        try:
+            connection.send(msg)
+        except Exception:
+            _connection = None
+            _close(connection)
+            raise
+
+
+@atexit.register
+def close_connection():
+    """Closes the pooled SMTP connection."""
+    global _connection
+    with _lock:
+        if _connection is not None:
+            _close(_connection)
+            _connection = None
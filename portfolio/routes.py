@@ -4,76 +4,257 @@ Portfolio Routes Module.
 Handles all URL routing for the portfolio, including:
 - Homepage rendering (showcasing projects)
 - Project listing
-- Resume downloads
 - Contact form submissions via SMTP
 - Project detail views
 """
 
+import functools
+import hashlib
 import os
-import json
 import re
+import threading
 from pathlib import Path
+import orjson
 from flask import (
     render_template,
     request,
-    send_file,
     current_app,
+    g,
     abort,
     jsonify,
     url_for,
 )
 from flask_mail import Message
-from . import portfolio_bp
+from flask_wtf.csrf import CSRFError, generate_csrf
+from . import portfolio_bp, cache, limiter
+from .mailer import send_message
 
 # Define paths for data files
 DATA_DIR = Path(__file__).parent / "data"
 PROJECTS_JSON = DATA_DIR / "projects.json"
 SITE_DATA_JSON = DATA_DIR / "site_data.json"
 
+# Templates only change on deploy, so hash them once for page ETags
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+_TEMPLATES_HASH = hashlib.blake2b(
+    b"".join(p.read_bytes() for p in sorted(TEMPLATES_DIR.glob("*.html"))),
+    digest_size=8,
+).hexdigest()
+
+# Views whose HTML depends only on the data files and templates
+CONDITIONAL_ENDPOINTS = {
+    "portfolio.home",
+    "portfolio.all_projects",
+    "portfolio.project_detail",
+}
+
+# Back button targets on the project detail page, keyed by ?from= referrer
+BACK_LINKS = {
+    "home": ("portfolio.home", "#projects", "Back to Home"),
+    "archive": ("portfolio.all_projects", "", "Back to All Projects"),
+    None: ("portfolio.all_projects", "", "Back to Projects"),
+}
+
+# Basic shape check for contact form email addresses.
+# The pattern backtracks quadratically on hostile input, so only run it on
+# addresses within the RFC 5321 length limit.
+EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+EMAIL_MAX_LENGTH = 254
+
+# Parsed JSON keyed by path -> (mtime_ns, size, data, views).
+# `views` holds values derived from `data` (see `_cached_view`).
+# Entries are refreshed whenever the file changes on disk.
+_JSON_CACHE = {}
+_JSON_CACHE_LOCK = threading.Lock()
+
 
 def load_json_data(path, default=None):
     """
     Safely loads JSON data from a given path.
+    Parsed data is memoized until the file's mtime or size changes.
     Returns the default value if the file is missing or corrupt.
     """
     if default is None:
         default = []
     try:
-        if not path.exists():
-            return default
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        stat = path.stat()
+        with _JSON_CACHE_LOCK:
+            cached = _JSON_CACHE.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        data = orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError):
+        # Unreadable file or invalid JSON (orjson.JSONDecodeError is a ValueError)
         current_app.logger.exception(f"Failed to load {path.name}")
         return default
 
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data, {})
+    return data
 
-@portfolio_bp.route("/", methods=["GET"])
-def home():
+
+def _cached_view(path, name, build, default=None):
     """
-    Renders the homepage.
-    Selects up to 3 featured projects for the hero section.
+    Returns `(data, build(data))` for the JSON at `path`. The derived value
+    is memoized alongside the parsed data and rebuilt only when the file changes.
     """
-    projects = load_json_data(PROJECTS_JSON, default=[])
-    site_data = load_json_data(SITE_DATA_JSON, default={})
+    data = load_json_data(path, default=default)
+    with _JSON_CACHE_LOCK:
+        cached = _JSON_CACHE.get(path)
+        # Missing or corrupt files fall back to `default`; don't memoize those.
+        if not cached or cached[2] is not data:
+            return data, build(data)
+        views = cached[3]
+        if name not in views:
+            views[name] = build(data)
+        return data, views[name]
+
+
+def _data_version():
+    """
+    Returns a token that changes whenever any page data file changes.
+    Computed once per request.
+    """
+    if "data_version" not in g:
+        version = []
+        for path in (PROJECTS_JSON, SITE_DATA_JSON):
+            try:
+                stat = path.stat()
+                version.append(f"{stat.st_mtime_ns}-{stat.st_size}")
+            except OSError:
+                version.append("missing")
+        g.data_version = ":".join(version)
+    return g.data_version
+
+
+def _skip_page_cache():
+    """Bypasses the page cache in debug mode, where templates reload live."""
+    return current_app.debug
+
+
+def _back_referrer():
+    """Returns the ?from= referrer as a BACK_LINKS key (unknown values map to None)."""
+    referrer = request.args.get("from")
+    return referrer if referrer in BACK_LINKS else None
 
+
+def _page_cache_key(*args, **kwargs):
+    """
+    Cache key for rendered pages: the URL path, the current data version and
+    template hash (the same inputs as the page ETag), plus the normalized
+    ?from= referrer on the detail page (its back link).
+    Other query strings never create separate entries.
+    """
+    key = f"page:{request.path}:{_data_version()}:{_TEMPLATES_HASH}"
+    if request.endpoint == "portfolio.project_detail":
+        key += f":{_back_referrer()}"
+    return key
+
+
+def _index_by_id(projects):
+    """Maps each project id to its position (first occurrence wins)."""
+    index = {}
+    for i, p in enumerate(projects):
+        index.setdefault(p["id"], i)
+    return index
+
+
+def _select_featured(projects):
+    """Picks up to 3 projects for the homepage, preferring 'featured' ones."""
     # Prioritize projects marked as 'featured'
     featured = [p for p in projects if p.get("featured")]
 
     if len(featured) >= 3:
-        featured_main = featured[:3]
-    else:
-        # Fallback: Fill remaining spots with unique top projects
-        seen = set()
-        top = []
-        for p in featured + projects:
-            pid = p.get("id")
-            if pid and pid not in seen:
-                top.append(p)
-                seen.add(pid)
-            if len(top) >= 3:
-                break
-        featured_main = top
+        return featured[:3]
+
+    # Fallback: Fill remaining spots with unique top projects
+    seen = set()
+    top = []
+    for p in featured + projects:
+        pid = p.get("id")
+        if pid and pid not in seen:
+            top.append(p)
+            seen.add(pid)
+        if len(top) >= 3:
+            break
+    return top
+
+
+def preload_data():
+    """
+    Parses all page data (and derived lookups) into the JSON cache up front.
+    Call once at startup inside an app context so the first request starts warm.
+    """
+    load_json_data(SITE_DATA_JSON, default={})
+    _cached_view(PROJECTS_JSON, "index", _index_by_id, default=[])
+    _cached_view(PROJECTS_JSON, "featured", _select_featured, default=[])
+
+
+def _is_valid_email(email):
+    """
+    Checks the basic shape of an email address.
+    Cheap string checks reject most malformed input before the regex runs.
+    """
+    if len(email) > EMAIL_MAX_LENGTH:
+        return False
+    at = email.find("@")
+    if at < 1 or "." not in email[at + 1:]:
+        return False
+    return EMAIL_REGEX.match(email) is not None
+
+
+@functools.lru_cache(maxsize=8)
+def _back_link(referrer, script_root):
+    """
+    Returns the (url, text) back link for a referrer.
+    Keyed on the script root too, since url_for output depends on it.
+    """
+    endpoint, fragment, text = BACK_LINKS[referrer]
+    return url_for(endpoint) + fragment, text
+
+
+def _deliver(app, mail, msg):
+    """Sends a contact message from a background worker."""
+    with app.app_context():
+        try:
+            send_message(mail, msg)
+        except Exception:
+            app.logger.exception("Failed to send email")
+
+
+@portfolio_bp.after_request
+def add_page_etag(response):
+    """
+    Tags data-driven pages with an ETag built from the data and template
+    versions, answering matching If-None-Match requests with 304.
+    """
+    if (
+        request.endpoint in CONDITIONAL_ENDPOINTS
+        and response.status_code == 200
+        and not current_app.debug  # templates reload live in debug mode
+    ):
+        etag = hashlib.blake2b(
+            f"{_data_version()}:{_TEMPLATES_HASH}".encode(), digest_size=8
+        ).hexdigest()
+        response.set_etag(etag)
+        response.make_conditional(request)
+    return response
+
+
+@portfolio_bp.route("/", methods=["GET"])
+@cache.cached(make_cache_key=_page_cache_key, unless=_skip_page_cache)
+def home():
+    """
+    Renders the homepage.
+    Selects up to 3 featured projects for the hero section.
+    """
+    projects, featured_main = _cached_view(
+        PROJECTS_JSON, "featured", _select_featured, default=[]
+    )
+    site_data = load_json_data(SITE_DATA_JSON, default={})
 
     return render_template(
         "index.html",
@@ -84,6 +265,7 @@ def home():
 
 
 @portfolio_bp.route("/projects", methods=["GET"])
+@cache.cached(make_cache_key=_page_cache_key, unless=_skip_page_cache)
 def all_projects():
     """Renders the full list of projects."""
     projects = load_json_data(PROJECTS_JSON, default=[])
@@ -91,24 +273,25 @@ def all_projects():
 
 
 @portfolio_bp.route("/project/<project_id>", methods=["GET"])
+@cache.cached(make_cache_key=_page_cache_key, unless=_skip_page_cache)
 def project_detail(project_id):
     """
     Renders the dedicated project detail page.
     Handles 'pipelined' navigation via the ?from= query parameter.
     Calculates Previous/Next projects for footer navigation using the single list.
     """
-    # 1. Load ALL projects from the single source
-    projects = load_json_data(PROJECTS_JSON, default=[])
+    # 1. Load ALL projects from the single source, indexed by id
+    projects, index = _cached_view(PROJECTS_JSON, "index", _index_by_id, default=[])
 
     # 2. Find the specific project
-    project = next((p for p in projects if p["id"] == project_id), None)
+    current_index = index.get(project_id)
 
-    if not project:
+    if current_index is None:
         abort(404)
 
-    # 3. Calculate Previous and Next
-    current_index = projects.index(project)
+    project = projects[current_index]
 
+    # 3. Calculate Previous and Next
     prev_project = None
     next_project = None
 
@@ -121,16 +304,7 @@ def project_detail(project_id):
         next_project = projects[current_index + 1]
 
     # 4. Handle Back Button Logic
-    referrer = request.args.get("from")
-    if referrer == "home":
-        back_url = url_for("portfolio.home") + "#projects"
-        back_text = "Back to Home"
-    elif referrer == "archive":
-        back_url = url_for("portfolio.all_projects")
-        back_text = "Back to All Projects"
-    else:
-        back_url = url_for("portfolio.all_projects")
-        back_text = "Back to Projects"
+    back_url, back_text = _back_link(_back_referrer(), request.script_root)
 
     return render_template(
         "project_detail.html",
@@ -142,46 +316,57 @@ def project_detail(project_id):
     )
 
 
-@portfolio_bp.route("/download-resume", methods=["GET"])
-def download_resume():
-    """
-    Serves the resume PDF for download.
-    """
-    filename = "muthukumaran-resume.pdf"
-    resume_path = Path(__file__).parent / "static" / "files" / filename
+@portfolio_bp.errorhandler(429)
+def rate_limited(error):
+    """Reports rate-limited contact submissions in the form's JSON format."""
+    return jsonify({
+        "status": "error",
+        "message": "Too many messages — please wait a while before trying again."
+    }), 429
 
-    if not resume_path.exists():
-        current_app.logger.error(f"Resume not found at {resume_path}")
-        abort(404)
 
-    return send_file(
-        resume_path,
-        as_attachment=True,
-        mimetype="application/pdf",
-        download_name=filename
-    )
+@portfolio_bp.errorhandler(CSRFError)
+def csrf_failed(error):
+    """Reports a missing or expired CSRF token in the form's JSON format."""
+    return jsonify({
+        "status": "error",
+        "message": "Security check failed — please try sending your message again."
+    }), 400
+
+
+@portfolio_bp.route("/contact/token", methods=["GET"])
+def contact_token():
+    """
+    Issues a CSRF token for the contact form.
+    Served separately so cached pages never carry a per-session token.
+    """
+    response = jsonify({"csrf_token": generate_csrf()})
+    response.headers["Cache-Control"] = "no-store"
+    return response
 
 
 @portfolio_bp.route("/contact", methods=["POST"])
+@limiter.limit("5 per minute; 30 per hour")
 def contact():
     """
     Handles AJAX contact form submissions.
-    Validates input and sends email via Flask-Mail.
+    Validates input and sends email via a pooled Flask-Mail connection,
+    queueing it on the mail executor when one is configured.
     """
+    current_app.extensions["csrf"].protect()
+
     # 1. Extract and sanitize input
     name = (request.form.get("name") or "").strip()
     email = (request.form.get("email") or "").strip()
     message = (request.form.get("message") or "").strip()
 
-    email_regex = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
-
     # 2. Validate input
     errors = []
     if not name:
         errors.append("Please enter your name.")
     if not email:
         errors.append("Please enter your email address.")
-    elif not email_regex.match(email):
+    elif not _is_valid_email(email):
         errors.append("Please enter a valid email address.")
     if not message:
         errors.append("Please enter a message.")
@@ -210,9 +395,14 @@ def contact():
         body=f"Name: {name}\nEmail: {email}\n\nMessage:\n{message}",
     )
 
+    msg.reply_to = email
+    executor = getattr(current_app, "mail_executor", None)
+    if executor:
+        executor.submit(_deliver, current_app._get_current_object(), mail, msg)
+        return jsonify({"status": "success", "message": "Thanks! Your message is on its way."}), 202
+
     try:
-        msg.reply_to = email
-        mail.send(msg)
+        send_message(mail, msg)
         return jsonify({"status": "success", "message": "Message sent successfully!"}), 200
     except Exception:
         current_app.logger.exception("Failed to send email")
@@ -602,7 +602,14 @@ document.addEventListener('click', (ev) => {
     const loadingToast = showToast('Sending your message...', 'loading');
 
     try {
+      // CSRF token is fetched on submit so the page HTML stays cacheable
+      const tokenResponse = await fetch(form.dataset.tokenUrl, {
+          headers: { 'X-Requested-With': 'XMLHttpRequest' }
+      });
+      const { csrf_token: csrfToken } = await tokenResponse.json();
+
       const formData = new FormData(form);
+      formData.set('csrf_token', csrfToken);
       const response = await fetch(form.action, {
           method: 'POST',
           body: formData,